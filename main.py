@@ -6,15 +6,15 @@ import pygame
 import sys
 import os
 
-from src.car import Car
+from src.car import Car, prune_rotation_cache
 from src.track import Track
 from src.camera import Camera
 from src.npc_car import NPCCar
 from src.data import Database
 from src.ui import Menu, GameState
-from src.car_stats import get_car_stats, get_car_image_name, get_random_car, CAR_COLORS
-import math
-import time
+from src.car_stats import get_car_stats, get_car_image_name, get_random_car, CAR_COLORS, CAR_TYPES
+from src.spatial_hash import SpatialHash
+from src.collide import find_collisions
 import random
 
 
@@ -22,6 +22,9 @@ import random
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
+MAX_UPDATES_PER_FRAME = 5  # Cap on catch-up physics steps after a slow frame
+COLLISION_RADIUS = 25
+CULL_MARGIN = 80  # Half the diagonal of the largest car sprite, rounded up
 
 # Colors
 WHITE = (255, 255, 255)
@@ -31,6 +34,14 @@ GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 GRAY = (128, 128, 128)
 
+# Full-screen menu states (drawn instead of the race)
+MENU_STATES = frozenset({
+    GameState.MENU,
+    GameState.TRACK_SELECT,
+    GameState.CAR_TYPE_SELECT,
+    GameState.CAR_COLOR_SELECT,
+})
+
 
 class Game:
     """Main game class."""
@@ -38,14 +49,29 @@ class Game:
     def __init__(self):
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        # Keep unused event types (mouse, joystick, ...) out of the queue entirely
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.WINDOWEXPOSED])
         pygame.display.set_caption("Racing Game")
         self.clock = pygame.time.Clock()
         self.running = True
 
+        # Keys currently held, maintained from KEYDOWN/KEYUP events
+        self._keys_down = set()
+
         # Get the base path for assets
         self.base_path = os.path.dirname(os.path.abspath(__file__))
         self.assets_path = os.path.join(self.base_path, "assets")
-        self.car_image_path = os.path.join(self.assets_path, "cars", "car_red_1.png")
+
+        # Load every car sprite once: (color, car_type) -> Surface
+        self._car_surfaces = {
+            (color, car_type): pygame.image.load(
+                os.path.join(self.assets_path, get_car_image_name(color, car_type))
+            ).convert_alpha()
+            for color in CAR_COLORS
+            for car_type in CAR_TYPES
+        }
 
         # Track selection
         self.track_index = 0
@@ -54,6 +80,9 @@ class Game:
         self.npc_count = 3
         self.npc_cars = []
 
+        # Broad-phase grid for car collisions
+        self.collision_grid = SpatialHash(COLLISION_RADIUS * 2)
+
         # Car selection (must be set before _load_track)
         self.selected_car_type = 1
         self.selected_car_color = "red"
@@ -63,6 +92,13 @@ class Game:
 
         # Initialize font for UI
         self.font = pygame.font.Font(None, 48)
+        self.hint_font = pygame.font.Font(None, 24)
+        self.hint_text = self.hint_font.render(
+            "T: Track | N: NPCs | R: Reset | WASD: Drive | ESC: Quit", True, GRAY
+        )
+
+        # Rendered UI text per slot: slot -> (value, color, fmt, surface)
+        self._text_cache = {}
 
         # Lap counting
         self.lap_count = 0
@@ -70,15 +106,15 @@ class Game:
         # Race position
         self.player_position = 1
 
-        # Timing
-        self.lap_start_time = time.time()
+        # Timing (lap start in pygame ticks, lap times in seconds)
+        self.lap_start_time = pygame.time.get_ticks()
         self.current_lap_time = 0.0
         self.best_lap_time = None
         self.last_lap_time = None
 
         # Database
         db_path = os.path.join(self.base_path, "data", "racing_game.db")
-        self.db = Database(db_path)
+        self.db = Database.get(db_path)
         self.player_name = "Player1"
         self.player_id = self.db.get_or_create_player(self.player_name)
         self._load_best_time()
@@ -87,6 +123,14 @@ class Game:
         self.menu = Menu(SCREEN_WIDTH, SCREEN_HEIGHT)
         self.game_state = GameState.MENU
 
+        # In-race key bindings
+        self._race_key_actions = {
+            pygame.K_ESCAPE: self.pause,
+            pygame.K_t: self.switch_track,
+            pygame.K_n: self.cycle_npc_count,
+            pygame.K_r: self.reset_race,
+        }
+
     def _load_track(self):
         """Load or reload the track and reset car position."""
         self.track = Track(self.assets_path, self.track_index)
@@ -96,17 +140,11 @@ class Game:
         start_angle = self.track.get_start_angle()
 
         # Get car image and stats
-        car_image = get_car_image_name(self.selected_car_color, self.selected_car_type)
-        self.car_image_path = os.path.join(self.assets_path, car_image)
+        car_image = self._car_surfaces[(self.selected_car_color, self.selected_car_type)]
         car_stats = get_car_stats(self.selected_car_type)
 
-        if hasattr(self, 'player_car'):
-            # Recreate car with new stats
-            self.player_car = Car(start_x, start_y, self.car_image_path, car_stats)
-            self.player_car.angle = start_angle
-        else:
-            self.player_car = Car(start_x, start_y, self.car_image_path, car_stats)
-            self.player_car.angle = start_angle
+        # Recreate car with new stats
+        self.player_car = Car(start_x, start_y, car_image, car_stats, start_angle)
 
         # Initialize camera
         if not hasattr(self, 'camera'):
@@ -117,7 +155,7 @@ class Game:
 
         # Reset lap count and timing on track change
         self.lap_count = 0
-        self.lap_start_time = time.time()
+        self.lap_start_time = pygame.time.get_ticks()
         self.current_lap_time = 0.0
         self.last_lap_time = None
 
@@ -141,44 +179,79 @@ class Game:
         for i, (x, y, wp_index) in enumerate(npc_positions):
             # Random car type and color
             color, car_type = get_random_car()
-            image_path = os.path.join(self.assets_path, get_car_image_name(color, car_type))
+            car_image = self._car_surfaces[(color, car_type)]
             car_stats = get_car_stats(car_type)
 
             difficulty = 0.6 + (i * 0.08)  # Vary difficulty slightly
-            npc = NPCCar(x, y, image_path, difficulty, car_stats)
+            npc = NPCCar(x, y, car_image, difficulty, car_stats)
             npc.current_waypoint = wp_index
             self.npc_cars.append(npc)
 
+        # Player first, then NPCs; reused by the collision pass every frame
+        self._all_cars = [self.player_car, *self.npc_cars]
+        self._prune_sprite_cache()
+
+    def _prune_sprite_cache(self):
+        """Release rotated frames of sprites that left the track."""
+        prune_rotation_cache(car.original_image for car in self._all_cars)
+
     def switch_track(self):
         """Switch to the next track."""
         self.track_index = (self.track_index + 1) % 2  # Toggle between 0 and 1
         self._load_track()
 
-    def handle_events(self):
-        """Handle pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+    def pause(self):
+        """Pause the race and open the pause menu."""
+        self.game_state = GameState.PAUSED
+        self.menu.selected_index = 0
+        self.menu.invalidate()
+
+    def handle_events(self) -> bool:
+        """
+        Handle pygame events.
+
+        Returns:
+            True if any event was handled (and may have changed game state)
+        """
+        keys_down = self._keys_down
+        race_key_actions = self._race_key_actions
+        KEYDOWN = pygame.KEYDOWN
+        KEYUP = pygame.KEYUP
+        PLAYING = GameState.PLAYING
+
+        # Only pull the event types we handle; discard the rest at the SDL layer
+        events = pygame.event.get(eventtype=(pygame.QUIT, KEYDOWN, KEYUP, pygame.WINDOWEXPOSED))
+        pygame.event.clear(pump=False)
+
+        for event in events:
+            event_type = event.type
+            if event_type == pygame.QUIT:
                 self.running = False
-                return
-
-            # Handle menu states
-            if self.game_state != GameState.PLAYING:
-                if event.type == pygame.KEYDOWN:
-                    new_state, actions = self.menu.handle_input(event, self.game_state)
-                    self._handle_menu_actions(new_state, actions)
-                return
+                return True
+
+            # Track held keys in every state so none get stuck
+            if event_type == KEYDOWN:
+                keys_down.add(event.key)
+            elif event_type == KEYUP:
+                keys_down.discard(event.key)
+                continue
+            else:
+                # Window exposed: menu needs repainting
+                self.menu.invalidate()
+                continue
+
+            # State can change mid-loop, so read it per event
+            if self.game_state != PLAYING:
+                new_state, actions = self.menu.handle_input(event, self.game_state)
+                self._handle_menu_actions(new_state, actions)
+                continue
 
             # Playing state - handle game input
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.game_state = GameState.PAUSED
-                    self.menu.selected_index = 0
-                elif event.key == pygame.K_t:
-                    self.switch_track()
-                elif event.key == pygame.K_n:
-                    self.cycle_npc_count()
-                elif event.key == pygame.K_r:
-                    self.reset_race()
+            action = race_key_actions.get(event.key)
+            if action:
+                action()
+
+        return bool(events)
 
     def _handle_menu_actions(self, new_state: GameState, actions: dict):
         """Handle actions from menu system."""
@@ -210,15 +283,15 @@ class Game:
 
     def _update_player_car(self):
         """Update player car with selected type and color."""
-        car_image = get_car_image_name(self.selected_car_color, self.selected_car_type)
-        self.car_image_path = os.path.join(self.assets_path, car_image)
+        car_image = self._car_surfaces[(self.selected_car_color, self.selected_car_type)]
         car_stats = get_car_stats(self.selected_car_type)
 
         if hasattr(self, 'player_car'):
             start_x, start_y = self.track.get_start_position()
             start_angle = self.track.get_start_angle()
-            self.player_car = Car(start_x, start_y, self.car_image_path, car_stats)
-            self.player_car.angle = start_angle
+            self.player_car = Car(start_x, start_y, car_image, car_stats, start_angle)
+            self._all_cars[0] = self.player_car
+            self._prune_sprite_cache()
 
     def reset_race(self):
         """Reset the race, saving results if laps completed."""
@@ -227,9 +300,9 @@ class Game:
         self._load_track()
 
     def _save_race(self):
-        """Save current race to database."""
+        """Queue current race to be saved by the database writer."""
         track_name = "Oval" if self.track_index == 0 else "Figure-8"
-        self.db.save_race(
+        self.db.queue_race(
             player_id=self.player_id,
             track=track_name,
             laps=self.lap_count,
@@ -244,27 +317,20 @@ class Game:
 
     def handle_input(self):
         """Handle continuous keyboard input for car controls."""
-        keys = pygame.key.get_pressed()
-
-        # WASD controls
-        if keys[pygame.K_w]:
-            self.player_car.accelerate()
-        if keys[pygame.K_s]:
-            self.player_car.brake()
-        if keys[pygame.K_a]:
-            self.player_car.rotate_left()
-        if keys[pygame.K_d]:
-            self.player_car.rotate_right()
-
-        # Arrow key controls (same functions)
-        if keys[pygame.K_UP]:
-            self.player_car.accelerate()
-        if keys[pygame.K_DOWN]:
-            self.player_car.brake()
-        if keys[pygame.K_LEFT]:
-            self.player_car.rotate_left()
-        if keys[pygame.K_RIGHT]:
-            self.player_car.rotate_right()
+        keys = self._keys_down
+        if not keys:
+            return
+
+        # WASD or arrow keys, each action applied at most once
+        car = self.player_car
+        if pygame.K_w in keys or pygame.K_UP in keys:
+            car.accelerate()
+        if pygame.K_s in keys or pygame.K_DOWN in keys:
+            car.brake()
+        if pygame.K_a in keys or pygame.K_LEFT in keys:
+            car.rotate_left()
+        if pygame.K_d in keys or pygame.K_RIGHT in keys:
+            car.rotate_right()
 
     def update(self):
         """Update game state."""
@@ -275,18 +341,20 @@ class Game:
         # Handle continuous input
         self.handle_input()
 
-        # Check if car is on road
-        player_x, player_y = self.player_car.get_position()
-        on_road = self.track.is_on_road(player_x, player_y)
+        track = self.track
+        player_car = self.player_car
 
         # Update player car with surface type and world bounds
-        self.player_car.update(on_road, self.world_width, self.world_height)
+        on_road = track.is_on_road(player_car.x, player_car.y)
+        player_car.update(on_road, self.world_width, self.world_height)
 
-        # Update NPC cars
-        for npc in self.npc_cars:
-            npc_x, npc_y = npc.get_position()
-            npc_on_road = self.track.is_on_road(npc_x, npc_y)
-            npc.update(self.track.waypoints, npc_on_road)
+        # Update NPC cars (surface checks batched before anyone moves)
+        npc_cars = self.npc_cars
+        waypoints = track.waypoints
+        npc_on_road = track.is_on_road_many([npc.x for npc in npc_cars],
+                                            [npc.y for npc in npc_cars])
+        for npc, npc_road in zip(npc_cars, npc_on_road):
+            npc.update(waypoints, npc_road)
 
         # Handle collisions between all cars
         self._handle_collisions()
@@ -295,12 +363,12 @@ class Game:
         self._update_positions()
 
         # Update current lap time
-        self.current_lap_time = time.time() - self.lap_start_time
+        now = pygame.time.get_ticks()
+        self.current_lap_time = (now - self.lap_start_time) / 1000.0
 
         # Check for lap completion
-        new_x, new_y = self.player_car.get_position()
-        prev_x = self.player_car.get_prev_x()
-        if self.track.check_finish_line(prev_x, new_x, new_y):
+        new_x, new_y = player_car.x, player_car.y
+        if track.check_finish_line(player_car.prev_x, new_x, new_y):
             self.lap_count += 1
             self.last_lap_time = self.current_lap_time
 
@@ -309,37 +377,29 @@ class Game:
                 self.best_lap_time = self.current_lap_time
 
             # Reset lap timer
-            self.lap_start_time = time.time()
+            self.lap_start_time = now
 
         # Update camera to follow player
         self.camera.update(new_x, new_y, self.world_width, self.world_height)
 
     def _handle_collisions(self):
         """Handle collisions between all cars."""
-        all_cars = [self.player_car] + self.npc_cars
-        collision_radius = 25
+        all_cars = self._all_cars
+        xs = [car.x for car in all_cars]
+        ys = [car.y for car in all_cars]
 
+        # Bucket cars into the grid so only nearby pairs are tested
+        grid = self.collision_grid
+        grid.clear()
         for i in range(len(all_cars)):
-            for j in range(i + 1, len(all_cars)):
-                car1 = all_cars[i]
-                car2 = all_cars[j]
+            grid.insert(i, xs[i], ys[i])
 
-                x1, y1 = car1.get_position()
-                x2, y2 = car2.get_position()
+        hits = find_collisions(xs, ys, grid.get_pairs(), COLLISION_RADIUS * 2)
 
-                dx = x2 - x1
-                dy = y2 - y1
-                dist = math.sqrt(dx * dx + dy * dy)
-
-                if dist < collision_radius * 2 and dist > 0:
-                    # Calculate push direction
-                    overlap = (collision_radius * 2 - dist) / 2
-                    push_x = (dx / dist) * overlap
-                    push_y = (dy / dist) * overlap
-
-                    # Push cars apart
-                    car1.apply_collision(-push_x, -push_y)
-                    car2.apply_collision(push_x, push_y)
+        # Push cars apart
+        for i, j, push_x, push_y in hits:
+            all_cars[i].apply_collision(-push_x, -push_y)
+            all_cars[j].apply_collision(push_x, push_y)
 
     def _update_positions(self):
         """Calculate race positions based on progress."""
@@ -349,35 +409,40 @@ class Game:
         player_progress = self.lap_count * len(waypoints) + self.player_car.get_progress(waypoints)
 
         # Count how many NPCs are ahead
-        position = 1
-        for npc in self.npc_cars:
-            npc_progress = npc.get_progress(waypoints)
-            if npc_progress > player_progress:
-                position += 1
-
-        self.player_position = position
+        ahead = sum(1 for npc in self.npc_cars if npc.get_progress(waypoints) > player_progress)
+        self.player_position = 1 + ahead
 
     def render(self):
         """Render the game."""
-        # Draw menu screens
-        if self.game_state in (GameState.MENU, GameState.TRACK_SELECT,
-                               GameState.CAR_TYPE_SELECT, GameState.CAR_COLOR_SELECT):
-            self.menu.draw(self.screen, self.game_state)
-            pygame.display.flip()
+        # Draw menu screens (the menu skips repaints when nothing changed)
+        if self.game_state in MENU_STATES:
+            if self.menu.draw(self.screen, self.game_state):
+                pygame.display.flip()
+            return
+
+        # A paused race is frozen, so only repaint when the pause menu changes
+        if self.game_state == GameState.PAUSED and not self.menu.needs_redraw():
             return
 
         # Clear screen
         self.screen.fill(BLACK)
 
-        # Get camera offset
-        camera_offset = self.camera.get_offset()
+        # Get camera offset, snapped to whole pixels once so the track and
+        # every car are shifted by exactly the same amount
+        cam_x, cam_y = self.camera.get_offset()
+        cam_x, cam_y = round(cam_x), round(cam_y)
+        camera_offset = (cam_x, cam_y)
 
         # Draw track
         self.track.draw(self.screen, camera_offset)
 
-        # Draw NPC cars
-        for npc in self.npc_cars:
-            npc.draw(self.screen, camera_offset)
+        # Draw on-screen NPC cars in one batch
+        left, top = cam_x - CULL_MARGIN, cam_y - CULL_MARGIN
+        right, bottom = cam_x + SCREEN_WIDTH + CULL_MARGIN, cam_y + SCREEN_HEIGHT + CULL_MARGIN
+        self.screen.blits([
+            npc.draw_args(camera_offset) for npc in self.npc_cars
+            if left <= npc.x <= right and top <= npc.y <= bottom
+        ], doreturn=0)
 
         # Draw player car
         self.player_car.draw(self.screen, camera_offset)
@@ -392,53 +457,72 @@ class Game:
         # Update display
         pygame.display.flip()
 
+    def _text(self, slot: str, fmt: str, value, color: tuple) -> pygame.Surface:
+        """
+        Return the rendered surface for a UI slot.
+
+        The text is only formatted (fmt % value) and re-rendered when the
+        value or color differs from what the slot last showed.
+        """
+        cached = self._text_cache.get(slot)
+        if cached and cached[0] == value and cached[1] == color and cached[2] == fmt:
+            return cached[3]
+
+        surface = self.font.render(fmt % value, True, color)
+        self._text_cache[slot] = (value, color, fmt, surface)
+        return surface
+
     def _draw_ui(self):
         """Draw the user interface elements."""
-        # Lap counter
-        lap_text = self.font.render(f"Lap: {self.lap_count}", True, WHITE)
-        self.screen.blit(lap_text, (20, 20))
-
-        # Position
         total_cars = 1 + len(self.npc_cars)
-        pos_text = self.font.render(f"Position: {self.player_position}/{total_cars}", True, WHITE)
-        self.screen.blit(pos_text, (20, 60))
+        track_name = "Oval" if self.track_index == 0 else "Figure-8"
 
-        # Current lap time
-        time_text = self.font.render(f"Time: {self.current_lap_time:.2f}s", True, WHITE)
-        self.screen.blit(time_text, (20, 100))
+        blit_list = [
+            # Lap counter, position and current lap time
+            (self._text("lap", "Lap: %d", self.lap_count, WHITE), (20, 20)),
+            (self._text("position", "Position: %d/%d", (self.player_position, total_cars), WHITE), (20, 60)),
+            (self._text("time", "Time: %.2fs", round(self.current_lap_time, 2), WHITE), (20, 100)),
+        ]
 
         # Best lap time
         if self.best_lap_time:
-            best_text = self.font.render(f"Best: {self.best_lap_time:.2f}s", True, GREEN)
+            best_text = self._text("best", "Best: %.2fs", self.best_lap_time, GREEN)
         else:
-            best_text = self.font.render("Best: --", True, GRAY)
-        self.screen.blit(best_text, (20, 140))
+            best_text = self._text("best", "Best: --", (), GRAY)
+        blit_list.append((best_text, (20, 140)))
 
         # Last lap time
         if self.last_lap_time:
-            last_text = self.font.render(f"Last: {self.last_lap_time:.2f}s", True, WHITE)
-            self.screen.blit(last_text, (20, 180))
+            blit_list.append((self._text("last", "Last: %.2fs", self.last_lap_time, WHITE), (20, 180)))
 
         # Right side info
-        track_name = "Oval" if self.track_index == 0 else "Figure-8"
-        track_text = self.font.render(f"Track: {track_name}", True, WHITE)
-        self.screen.blit(track_text, (SCREEN_WIDTH - 250, 20))
-
-        npc_text = self.font.render(f"NPCs: {self.npc_count}", True, WHITE)
-        self.screen.blit(npc_text, (SCREEN_WIDTH - 250, 60))
+        blit_list.append((self._text("track", "Track: %s", track_name, WHITE), (SCREEN_WIDTH - 250, 20)))
+        blit_list.append((self._text("npcs", "NPCs: %d", self.npc_count, WHITE), (SCREEN_WIDTH - 250, 60)))
 
         # Controls hint
-        hint_font = pygame.font.Font(None, 24)
-        hint_text = hint_font.render("T: Track | N: NPCs | R: Reset | WASD: Drive | ESC: Quit", True, GRAY)
-        self.screen.blit(hint_text, (20, SCREEN_HEIGHT - 30))
+        blit_list.append((self.hint_text, (20, SCREEN_HEIGHT - 30)))
+
+        self.screen.blits(blit_list, doreturn=0)
 
     def run(self):
         """Main game loop."""
+        step = 1.0 / FPS
+        accumulator = 0.0
+
         while self.running:
-            self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(FPS)
+            changed = self.handle_events()
+
+            # Run physics in fixed steps, decoupled from render speed
+            accumulator += self.clock.tick(FPS) / 1000.0
+            accumulator = min(accumulator, step * MAX_UPDATES_PER_FRAME)
+            while accumulator >= step:
+                self.update()
+                accumulator -= step
+                changed = True
+
+            # Nothing moved and no input arrived, so the last frame still stands
+            if changed:
+                self.render()
 
         # Save race on exit if laps completed
         if self.lap_count > 0:
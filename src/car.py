@@ -4,26 +4,87 @@ Car class with arcade-style physics.
 
 import pygame
 import math
-from typing import Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Sprites are rotated in fixed steps and cached per source image
+ROTATION_STEPS = 72
+ROTATION_STEP_DEGREES = 360 / ROTATION_STEPS
+_rotation_cache: Dict[pygame.Surface, List[Optional[pygame.Surface]]] = {}
+
+# Heading lookup tables, indexed by whole degrees
+SIN_TABLE = tuple(math.sin(math.radians(a)) for a in range(360))
+COS_TABLE = tuple(math.cos(math.radians(a)) for a in range(360))
+
+
+def get_rotated_image(image: pygame.Surface, angle: float) -> pygame.Surface:
+    """
+    Get a sprite rotated to the nearest cached step of an angle.
+
+    Frames are rendered on first use and shared by every car using the
+    same source surface.
+
+    Args:
+        image: Unrotated sprite surface
+        angle: Rotation in degrees (counter-clockwise)
+    """
+    frames = _rotation_cache.get(image)
+    if frames is None:
+        frames = _rotation_cache[image] = [None] * ROTATION_STEPS
+
+    step = round(angle / ROTATION_STEP_DEGREES) % ROTATION_STEPS
+    frame = frames[step]
+    if frame is None:
+        frame = frames[step] = pygame.transform.rotate(image, step * ROTATION_STEP_DEGREES)
+    return frame
+
+
+def prune_rotation_cache(in_use: Iterable[pygame.Surface]):
+    """
+    Drop cached rotations for sprites no car is using any more.
+
+    Args:
+        in_use: Source surfaces of the cars currently on track
+    """
+    keep = set(in_use)
+    for image in [image for image in _rotation_cache if image not in keep]:
+        del _rotation_cache[image]
 
 
 class Car:
     """A car with arcade-style physics."""
 
-    def __init__(self, x: float, y: float, image_path: str, stats: dict = None):
+    __slots__ = (
+        'x', 'y', 'prev_x', 'angle', 'velocity',
+        'max_velocity', 'acceleration', 'rotation_speed', 'durability',
+        'original_image', 'image', '_last_angle', '_half_size',
+    )
+
+    # Physics constants
+    brake_strength = 0.3
+    friction = 0.02
+    grass_friction = 0.08  # Higher friction on grass
+    min_velocity_for_rotation = 0.5
+
+    # Car dimensions for collision (approximate)
+    collision_radius = 20
+
+    def __init__(self, x: float, y: float, image: pygame.Surface, stats: dict = None,
+                 angle: float = 0):
         """
         Initialize the car.
 
         Args:
             x: Initial x position
             y: Initial y position
-            image_path: Path to the car sprite image
+            image: Car sprite surface (already converted for the display)
             stats: Optional dict with max_velocity, acceleration, handling, durability
+            angle: Initial heading in degrees, 0 = facing up
         """
         self.x = x
         self.y = y
         self.prev_x = x  # Track previous position for lap detection
-        self.angle = 0  # Degrees, 0 = facing up
+        self.angle = angle
         self.velocity = 0.0
 
         # Apply stats or use defaults
@@ -38,19 +99,19 @@ class Car:
             self.rotation_speed = 3.0
             self.durability = 1.0
 
-        # Physics constants
-        self.brake_strength = 0.3
-        self.friction = 0.02
-        self.grass_friction = 0.08  # Higher friction on grass
-        self.min_velocity_for_rotation = 0.5
-
-        # Load and store the original image
-        self.original_image = pygame.image.load(image_path).convert_alpha()
-        self.image = self.original_image
-        self.rect = self.image.get_rect(center=(x, y))
+        # Store the original image and face the sprite along the heading,
+        # so the car draws correctly even before its first update()
+        self.original_image = image
+        self._last_angle = None  # Angle self.image was rotated to
+        self._update_sprite()
 
-        # Car dimensions for collision (approximate)
-        self.collision_radius = 20
+    def _update_sprite(self):
+        """Rotate the sprite to the current angle if it changed."""
+        if self.angle != self._last_angle:
+            self.image = get_rotated_image(self.original_image, self.angle)
+            width, height = self.image.get_size()
+            self._half_size = (width // 2, height // 2)
+            self._last_angle = self.angle
 
     def accelerate(self):
         """Accelerate the car forward."""
@@ -90,14 +151,9 @@ class Car:
         """
         friction = self.friction if on_road else self.grass_friction
 
-        if self.velocity > 0:
-            self.velocity -= friction
-            if self.velocity < 0:
-                self.velocity = 0
-        elif self.velocity < 0:
-            self.velocity += friction
-            if self.velocity > 0:
-                self.velocity = 0
+        # Slow toward zero without overshooting past it
+        v = self.velocity
+        self.velocity = 0.0 if abs(v) <= friction else v - math.copysign(friction, v)
 
     def update(self, on_road: bool = True, world_width: int = 0, world_height: int = 0):
         """
@@ -118,12 +174,12 @@ class Car:
         if not on_road and self.velocity > self.max_velocity * 0.5:
             self.velocity = self.max_velocity * 0.5
 
-        # Convert angle to radians for movement calculation
-        angle_rad = math.radians(self.angle)
+        # Look up heading to the nearest whole degree
+        heading = round(self.angle) % 360
 
         # Calculate new position
-        new_x = self.x - self.velocity * math.sin(angle_rad)
-        new_y = self.y - self.velocity * math.cos(angle_rad)
+        new_x = self.x - self.velocity * SIN_TABLE[heading]
+        new_y = self.y - self.velocity * COS_TABLE[heading]
 
         # Boundary collision
         if world_width > 0 and world_height > 0:
@@ -149,9 +205,8 @@ class Car:
         self.x = new_x
         self.y = new_y
 
-        # Rotate the image
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
-        self.rect = self.image.get_rect(center=(self.x, self.y))
+        # Rotate the image only when the heading changed
+        self._update_sprite()
 
     def reset(self, x: float, y: float, angle: float):
         """Reset car to a position and angle."""
@@ -160,6 +215,7 @@ class Car:
         self.prev_x = x
         self.angle = angle
         self.velocity = 0.0
+        self._update_sprite()
 
     def draw(self, screen: pygame.Surface, camera_offset: Tuple[float, float] = (0, 0)):
         """
@@ -169,10 +225,8 @@ class Car:
             screen: Pygame surface to draw on
             camera_offset: Tuple of (x, y) camera offset
         """
-        draw_x = self.x - camera_offset[0]
-        draw_y = self.y - camera_offset[1]
-        draw_rect = self.image.get_rect(center=(draw_x, draw_y))
-        screen.blit(self.image, draw_rect)
+        half_w, half_h = self._half_size
+        screen.blit(self.image, (self.x - camera_offset[0] - half_w, self.y - camera_offset[1] - half_h))
 
     def get_position(self) -> Tuple[float, float]:
         """Return the car's current position."""
@@ -196,18 +250,15 @@ class Car:
         if not waypoints:
             return 0.0
 
-        # Find the nearest waypoint ahead
-        min_dist = float('inf')
-        nearest_wp = 0
-
-        for i, (wx, wy) in enumerate(waypoints):
-            dist = math.sqrt((wx - self.x) ** 2 + (wy - self.y) ** 2)
-            if dist < min_dist:
-                min_dist = dist
-                nearest_wp = i
+        # Find the nearest waypoint ahead (compare squared distances)
+        x, y = self.x, self.y
+        min_dist_sq, nearest_wp = min(
+            ((wx - x) * (wx - x) + (wy - y) * (wy - y), i)
+            for i, (wx, wy) in enumerate(waypoints)
+        )
 
         # Progress = waypoint index + fraction based on distance
         max_dist = 200
-        fraction = 1.0 - min(min_dist / max_dist, 1.0)
+        fraction = 1.0 - min(math.sqrt(min_dist_sq) / max_dist, 1.0)
 
         return nearest_wp + fraction
@@ -0,0 +1,41 @@
+"""
+Narrow-phase collision checks between cars.
+"""
+
+from math import hypot
+from typing import Iterable, List, Sequence, Tuple
+
+
+def find_collisions(xs: Sequence[float], ys: Sequence[float],
+                    pairs: Iterable[Tuple[int, int]],
+                    min_dist: float) -> List[Tuple[int, int, float, float]]:
+    """
+    Find overlapping pairs and the push needed to separate them.
+
+    Args:
+        xs: X positions of all cars
+        ys: Y positions of all cars
+        pairs: Candidate (i, j) index pairs from the broad phase
+        min_dist: Distance below which two cars overlap
+
+    Returns:
+        List of (i, j, push_x, push_y) tuples. Car j should be pushed by
+        (push_x, push_y) and car i by the negated vector.
+    """
+    min_dist_sq = min_dist * min_dist
+    hits = []
+
+    for i, j in pairs:
+        # Cheap per-axis reject before the squared distance
+        dx = xs[j] - xs[i]
+        if dx >= min_dist or dx <= -min_dist:
+            continue
+        dy = ys[j] - ys[i]
+        dist_sq = dx * dx + dy * dy
+
+        if 0 < dist_sq < min_dist_sq:
+            dist = hypot(dx, dy)
+            scale = (min_dist - dist) / 2 / dist
+            hits.append((i, j, dx * scale, dy * scale))
+
+    return hits
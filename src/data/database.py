@@ -4,25 +4,99 @@ SQLite database for saving race data.
 
 import sqlite3
 import os
+import atexit
+import queue
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
+
+
+# Statements reused on every call (sqlite3 keeps them prepared in its cache)
+_SQL_GET_PLAYER = 'SELECT id FROM players WHERE name = ?'
+_SQL_INSERT_PLAYER = 'INSERT INTO players (name) VALUES (?)'
+_SQL_INSERT_RACE = '''
+    INSERT INTO races (player_id, track, laps, best_lap_time, total_time)
+    VALUES (?, ?, ?, ?, ?)
+'''
+_SQL_BEST_LAP = '''
+    SELECT MIN(best_lap_time) as best
+    FROM races
+    WHERE player_id = ? AND track = ? AND best_lap_time IS NOT NULL
+'''
+_SQL_TRACK_RECORD = '''
+    SELECT p.name, MIN(r.best_lap_time) as best
+    FROM races r
+    JOIN players p ON r.player_id = p.id
+    WHERE r.track = ? AND r.best_lap_time IS NOT NULL
+    GROUP BY r.track
+    ORDER BY best
+    LIMIT 1
+'''
+_SQL_GET_SETTING = 'SELECT value FROM settings WHERE key = ?'
+_SQL_SET_SETTING = 'INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)'
 
 
 class Database:
     """SQLite database manager for race data."""
 
-    def __init__(self, db_path: str):
+    # Shared connections, one per database path (see get())
+    _instances: Dict[str, "Database"] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def get(cls, db_path: str) -> "Database":
+        """
+        Get the shared database for a path, opening it on first use.
+
+        Args:
+            db_path: Path to SQLite database file
+
+        Returns:
+            The long-lived Database instance for db_path
+        """
+        key = os.path.abspath(db_path)
+        with cls._instances_lock:
+            db = cls._instances.get(key)
+            if db is None:
+                db = cls._instances[key] = cls(db_path)
+            return db
+
+    @classmethod
+    def _close_all(cls):
+        """Close every shared database (registered with atexit)."""
+        with cls._instances_lock:
+            instances = list(cls._instances.values())
+        for db in instances:
+            db.close()
+
+    def __init__(self, db_path: str, flush_interval: float = 2.0):
         """
         Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file
+            flush_interval: Seconds between background flushes of queued races
         """
         self.db_path = db_path
         self.conn = None
+        self.flush_interval = flush_interval
+
+        # The connection is shared with the writer thread
+        self._lock = threading.RLock()
+        self._pending: "queue.Queue[tuple]" = queue.Queue()
+        self._unsaved: List[tuple] = []  # Dequeued rows whose write failed
+        self._stop = threading.Event()
+
+        # True while an explicit transaction() block is open
+        self._in_transaction = False
+
         self._connect()
         self._create_tables()
 
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
     def _connect(self):
         """Establish database connection."""
         # Create directory if needed
@@ -30,9 +104,20 @@ class Database:
         if db_dir and not os.path.exists(db_dir):
             os.makedirs(db_dir)
 
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
 
+        # Write-ahead logging: commits append to <db>-wal (with a <db>-shm
+        # index alongside) and only fsync at checkpoints. Must run outside
+        # a transaction, so it goes before any table setup.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-8192")  # 8 MiB page cache
+
+        # Memory-map reads (only the existing file size is actually mapped)
+        self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+
     def _create_tables(self):
         """Create tables if they don't exist."""
         cursor = self.conn.cursor()
@@ -68,77 +153,165 @@ class Database:
             )
         ''')
 
+        # Covering indexes for best-lap and track-record lookups
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_races_player_track
+            ON races(player_id, track, best_lap_time)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_races_track_best
+            ON races(track, best_lap_time)
+        ''')
+
         self.conn.commit()
 
+        # Give the query planner index statistics from the first session;
+        # PRAGMA optimize on close keeps them current afterwards
+        has_stats = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        if not has_stats:
+            cursor.execute("ANALYZE")
+            self.conn.commit()
+
     def get_or_create_player(self, name: str) -> int:
         """Get player ID, creating if doesn't exist."""
-        cursor = self.conn.cursor()
+        with self._lock:
+            # Try to get existing player
+            row = self.conn.execute(_SQL_GET_PLAYER, (name,)).fetchone()
 
-        # Try to get existing player
-        cursor.execute('SELECT id FROM players WHERE name = ?', (name,))
-        row = cursor.fetchone()
+            if row:
+                return row['id']
 
-        if row:
-            return row['id']
-
-        # Create new player
-        cursor.execute('INSERT INTO players (name) VALUES (?)', (name,))
-        self.conn.commit()
-        return cursor.lastrowid
+            # Create new player
+            cursor = self.conn.execute(_SQL_INSERT_PLAYER, (name,))
+            self._commit()
+            return cursor.lastrowid
 
     def save_race(self, player_id: int, track: str, laps: int,
                   best_lap_time: Optional[float], total_time: Optional[float]):
-        """Save a race result."""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO races (player_id, track, laps, best_lap_time, total_time)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (player_id, track, laps, best_lap_time, total_time))
-        self.conn.commit()
+        """Save a race result (committed at block exit inside transaction())."""
+        with self._lock:
+            self.conn.execute(_SQL_INSERT_RACE, (player_id, track, laps, best_lap_time, total_time))
+            self._commit()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several writes into one transaction with a single commit.
+
+        Writes made inside the block skip their own commit; everything is
+        committed when the block exits, or rolled back if it raises. A
+        nested transaction() joins the outer one, which owns the commit.
+        """
+        with self._lock:
+            if self.conn.in_transaction:
+                yield self
+                return
+
+            self.conn.execute("BEGIN")
+            self._in_transaction = True
+            try:
+                yield self
+            except BaseException:
+                self.conn.rollback()
+                raise
+            else:
+                self.conn.commit()
+            finally:
+                self._in_transaction = False
+
+    def _commit(self):
+        """Commit a write, unless it is part of an open transaction() block."""
+        if not self._in_transaction:
+            self.conn.commit()
+
+    def queue_race(self, player_id: int, track: str, laps: int,
+                   best_lap_time: Optional[float], total_time: Optional[float]):
+        """Queue a race result to be written by the background writer."""
+        self._pending.put((player_id, track, laps, best_lap_time, total_time))
+
+    def flush(self):
+        """Write all queued race results in one batch."""
+        # Drain under the lock so a reader that flushes first never sees a
+        # result that the writer thread has dequeued but not yet inserted
+        with self._lock:
+            batch = self._unsaved
+            self._unsaved = []
+            while True:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+
+            if not batch:
+                return
+
+            try:
+                self.conn.executemany(_SQL_INSERT_RACE, batch)
+                self._commit()
+            except sqlite3.Error:
+                # Keep the rows for the next flush instead of losing them
+                if not self._in_transaction:
+                    self.conn.rollback()
+                self._unsaved = batch
+                raise
+
+    def _writer_loop(self):
+        """Periodically flush queued races until the database is closed."""
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except sqlite3.Error:
+                # Transient (e.g. database is locked): the rows are kept and
+                # retried next time; a flush on the main thread (reads,
+                # close()) still raises if the problem persists
+                continue
 
     def get_best_lap_time(self, player_id: int, track: str) -> Optional[float]:
         """Get player's best lap time for a track."""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT MIN(best_lap_time) as best
-            FROM races
-            WHERE player_id = ? AND track = ? AND best_lap_time IS NOT NULL
-        ''', (player_id, track))
-        row = cursor.fetchone()
-        return row['best'] if row and row['best'] else None
+        with self._lock:
+            # Make sure queued races are visible to the query
+            self.flush()
+
+            row = self.conn.execute(_SQL_BEST_LAP, (player_id, track)).fetchone()
+            return row['best'] if row and row['best'] else None
 
     def get_track_record(self, track: str) -> Optional[Tuple[str, float]]:
         """Get the track record (best lap time by any player)."""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT p.name, MIN(r.best_lap_time) as best
-            FROM races r
-            JOIN players p ON r.player_id = p.id
-            WHERE r.track = ? AND r.best_lap_time IS NOT NULL
-            GROUP BY r.track
-            ORDER BY best
-            LIMIT 1
-        ''', (track,))
-        row = cursor.fetchone()
-        return (row['name'], row['best']) if row and row['best'] else None
+        with self._lock:
+            self.flush()
+
+            row = self.conn.execute(_SQL_TRACK_RECORD, (track,)).fetchone()
+            return (row['name'], row['best']) if row and row['best'] else None
 
     def get_setting(self, key: str, default: str = '') -> str:
         """Get a setting value."""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
-        row = cursor.fetchone()
-        return row['value'] if row else default
+        with self._lock:
+            row = self.conn.execute(_SQL_GET_SETTING, (key,)).fetchone()
+            return row['value'] if row else default
 
     def set_setting(self, key: str, value: str):
         """Set a setting value."""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)
-        ''', (key, value))
-        self.conn.commit()
+        with self._lock:
+            self.conn.execute(_SQL_SET_SETTING, (key, value))
+            self._commit()
 
     def close(self):
-        """Close database connection."""
+        """Flush queued races and close database connection."""
+        self._stop.set()
+        self._writer.join()
+
         if self.conn:
+            self.flush()
+            self.conn.execute("PRAGMA optimize")
             self.conn.close()
             self.conn = None
+
+        with Database._instances_lock:
+            key = os.path.abspath(self.db_path)
+            if Database._instances.get(key) is self:
+                del Database._instances[key]
+
+
+atexit.register(Database._close_all)
@@ -6,18 +6,35 @@ import pygame
 import math
 from typing import Tuple, List
 
+from .car import get_rotated_image, SIN_TABLE, COS_TABLE
+
 
 class NPCCar:
     """An AI-controlled car that follows waypoints."""
 
-    def __init__(self, x: float, y: float, image_path: str, difficulty: float = 0.7, stats: dict = None):
+    __slots__ = (
+        'x', 'y', 'prev_x', 'angle', 'velocity', 'difficulty_multiplier',
+        'acceleration', 'rotation_speed', 'max_velocity', 'current_waypoint',
+        'original_image', 'image',
+    )
+
+    # Physics constants
+    friction = 0.02
+    waypoint_threshold = 60  # Distance to consider waypoint reached
+    waypoint_threshold_sq = waypoint_threshold * waypoint_threshold
+    progress_max_dist = 200  # Approximate max distance between waypoints
+
+    # Collision
+    collision_radius = 20
+
+    def __init__(self, x: float, y: float, image: pygame.Surface, difficulty: float = 0.7, stats: dict = None):
         """
         Initialize the NPC car.
 
         Args:
             x: Initial x position
             y: Initial y position
-            image_path: Path to the car sprite image
+            image: Car sprite surface (already converted for the display)
             difficulty: Speed multiplier (0.5 = easy, 1.0 = hard)
             stats: Optional dict with car stats
         """
@@ -38,21 +55,15 @@ class NPCCar:
             self.acceleration = 0.12
             self.rotation_speed = 2.5
 
-        # Physics constants (scaled by difficulty)
+        # Top speed scaled by difficulty
         self.max_velocity = base_velocity * difficulty
-        self.friction = 0.02
 
         # Waypoint tracking
         self.current_waypoint = 0
-        self.waypoint_threshold = 60  # Distance to consider waypoint reached
 
-        # Load image
-        self.original_image = pygame.image.load(image_path).convert_alpha()
+        # Sprite image
+        self.original_image = image
         self.image = self.original_image
-        self.rect = self.image.get_rect(center=(x, y))
-
-        # Collision
-        self.collision_radius = 20
 
     def update(self, waypoints: List[Tuple[float, float]], on_road: bool = True):
         """
@@ -97,19 +108,17 @@ class NPCCar:
         if self.velocity < 0:
             self.velocity = 0
 
-        # Move
-        angle_rad = math.radians(self.angle)
-        self.x -= self.velocity * math.sin(angle_rad)
-        self.y -= self.velocity * math.cos(angle_rad)
+        # Move along the heading, looked up to the nearest whole degree
+        heading = round(self.angle) % 360
+        self.x -= self.velocity * SIN_TABLE[heading]
+        self.y -= self.velocity * COS_TABLE[heading]
 
         # Check if reached waypoint
-        dist = math.sqrt(dx * dx + dy * dy)
-        if dist < self.waypoint_threshold:
+        if dx * dx + dy * dy < self.waypoint_threshold_sq:
             self.current_waypoint = (self.current_waypoint + 1) % len(waypoints)
 
         # Update image rotation
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
-        self.rect = self.image.get_rect(center=(self.x, self.y))
+        self.image = get_rotated_image(self.original_image, self.angle)
 
     def get_position(self) -> Tuple[float, float]:
         """Return current position."""
@@ -126,20 +135,25 @@ class NPCCar:
         target_x, target_y = waypoints[self.current_waypoint]
         dx = target_x - self.x
         dy = target_y - self.y
-        dist = math.sqrt(dx * dx + dy * dy)
+        dist_sq = dx * dx + dy * dy
 
         # Progress = current waypoint + (1 - normalized distance to next)
-        max_dist = 200  # Approximate max distance between waypoints
-        fraction = 1.0 - min(dist / max_dist, 1.0)
+        max_dist = self.progress_max_dist
+        if dist_sq >= max_dist * max_dist:
+            return float(self.current_waypoint)
+        fraction = 1.0 - math.sqrt(dist_sq) / max_dist
 
         return self.current_waypoint + fraction
 
-    def draw(self, screen: pygame.Surface, camera_offset: Tuple[float, float] = (0, 0)):
-        """Draw the car on screen."""
+    def draw_args(self, camera_offset: Tuple[float, float] = (0, 0)) -> Tuple[pygame.Surface, pygame.Rect]:
+        """Return the (surface, rect) pair to blit, for batching with Surface.blits."""
         draw_x = self.x - camera_offset[0]
         draw_y = self.y - camera_offset[1]
-        draw_rect = self.image.get_rect(center=(draw_x, draw_y))
-        screen.blit(self.image, draw_rect)
+        return self.image, self.image.get_rect(center=(draw_x, draw_y))
+
+    def draw(self, screen: pygame.Surface, camera_offset: Tuple[float, float] = (0, 0)):
+        """Draw the car on screen."""
+        screen.blit(*self.draw_args(camera_offset))
 
     def apply_collision(self, push_x: float, push_y: float):
         """Apply collision response."""
@@ -0,0 +1,59 @@
+"""
+Uniform grid spatial hash for broad-phase collision checks.
+"""
+
+from typing import Dict, List, Tuple
+
+
+class SpatialHash:
+    """A uniform grid that buckets object indices by world position."""
+
+    def __init__(self, cell_size: float):
+        """
+        Initialize the spatial hash.
+
+        Args:
+            cell_size: Width/height of a grid cell (should be >= the collision distance)
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def clear(self):
+        """Remove all objects from the grid."""
+        self.cells.clear()
+
+    def insert(self, index: int, x: float, y: float):
+        """Insert an object index at a world position."""
+        key = (int(x // self.cell_size), int(y // self.cell_size))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            self.cells[key] = [index]
+        else:
+            bucket.append(index)
+
+    def get_pairs(self) -> List[Tuple[int, int]]:
+        """
+        Get candidate pairs of objects in the same or neighboring cells.
+
+        Returns list of (i, j) tuples with i < j, in ascending order.
+        """
+        cells = self.cells
+        pairs = []
+
+        for (cx, cy), bucket in cells.items():
+            # Pairs within the cell
+            for a, i in enumerate(bucket):
+                for j in bucket[a + 1:]:
+                    pairs.append((i, j) if i < j else (j, i))
+
+            # Pairs with the forward half of the 3x3 neighbourhood, so each
+            # pair of adjacent cells is visited exactly once
+            for key in ((cx + 1, cy - 1), (cx + 1, cy), (cx + 1, cy + 1), (cx, cy + 1)):
+                other = cells.get(key)
+                if other:
+                    for i in bucket:
+                        for j in other:
+                            pairs.append((i, j) if i < j else (j, i))
+
+        pairs.sort()
+        return pairs
@@ -3,7 +3,7 @@ Track class for rendering tile-based racing tracks.
 """
 
 import pygame
-from typing import List, Tuple, Dict
+from typing import List, Sequence, Tuple, Dict
 
 
 # Tile types
@@ -18,6 +18,35 @@ CORNER_BR = 6   # Bottom-right corner
 # Road tiles set (for checking if on road)
 ROAD_TILES = {ROAD_V, ROAD_H, CORNER_TL, CORNER_TR, CORNER_BL, CORNER_BR}
 
+# Decoded tile images by path, shared by every Track instance
+_IMAGE_CACHE: Dict[str, pygame.Surface] = {}
+
+# Baked world surfaces by (assets_path, track_index); tracks never change
+_WORLD_CACHE: Dict[Tuple[str, int], pygame.Surface] = {}
+
+
+def _load_image(path: str, alpha: bool = True) -> pygame.Surface:
+    """Load and convert an image, reusing it if it was loaded before."""
+    image = _IMAGE_CACHE.get(path)
+    if image is None:
+        image = pygame.image.load(path)
+        image = image.convert_alpha() if alpha else image.convert()
+        _IMAGE_CACHE[path] = image
+    return image
+
+
+def _load_road_tile(path: str, grass: pygame.Surface) -> pygame.Surface:
+    """Load a road tile pre-blended onto grass as an opaque surface."""
+    key = f"{path}#on-grass"
+    tile = _IMAGE_CACHE.get(key)
+    if tile is None:
+        # Copy so the shared grass image is left untouched
+        tile = grass.copy()
+        tile.blit(_load_image(path), (0, 0))
+        tile = tile.convert()
+        _IMAGE_CACHE[key] = tile
+    return tile
+
 
 class Track:
     """A tile-based racing track."""
@@ -34,6 +63,8 @@ class Track:
         self.tile_size = 128  # Kenney tiles are 128x128
         self.tiles: Dict[int, pygame.Surface] = {}
         self.track_data: List[List[int]] = []
+        self.tile_grid = b""  # Row-major copy of track_data, one byte per tile
+        self.road_mask: List[bool] = []  # Row-major, True where the tile is road
         self.width = 0
         self.height = 0
         self.track_index = track_index
@@ -51,18 +82,28 @@ class Track:
 
         # Load selected track
         self._load_track(track_index)
+        self._build_lookups()
+
+        # Pre-render the static track so drawing is a single blit
+        world_key = (assets_path, track_index)
+        self.world_surface = _WORLD_CACHE.get(world_key)
+        if self.world_surface is None:
+            self.world_surface = _WORLD_CACHE[world_key] = self._render_world()
 
     def _load_tiles(self, assets_path: str):
         """Load all tile images."""
         roads_path = f"{assets_path}/roads"
 
-        self.tiles[GRASS] = pygame.image.load(f"{roads_path}/land_grass04.png").convert()
-        self.tiles[ROAD_V] = pygame.image.load(f"{roads_path}/road_asphalt01.png").convert_alpha()
-        self.tiles[ROAD_H] = pygame.image.load(f"{roads_path}/road_asphalt43.png").convert_alpha()
-        self.tiles[CORNER_TL] = pygame.image.load(f"{roads_path}/road_asphalt26.png").convert_alpha()
-        self.tiles[CORNER_TR] = pygame.image.load(f"{roads_path}/road_asphalt29.png").convert_alpha()
-        self.tiles[CORNER_BL] = pygame.image.load(f"{roads_path}/road_asphalt28.png").convert_alpha()
-        self.tiles[CORNER_BR] = pygame.image.load(f"{roads_path}/road_asphalt27.png").convert_alpha()
+        grass = _load_image(f"{roads_path}/land_grass04.png", alpha=False)
+        self.tiles[GRASS] = grass
+
+        # Road tiles come pre-blended onto grass, so each is one opaque blit
+        self.tiles[ROAD_V] = _load_road_tile(f"{roads_path}/road_asphalt01.png", grass)
+        self.tiles[ROAD_H] = _load_road_tile(f"{roads_path}/road_asphalt43.png", grass)
+        self.tiles[CORNER_TL] = _load_road_tile(f"{roads_path}/road_asphalt26.png", grass)
+        self.tiles[CORNER_TR] = _load_road_tile(f"{roads_path}/road_asphalt29.png", grass)
+        self.tiles[CORNER_BL] = _load_road_tile(f"{roads_path}/road_asphalt28.png", grass)
+        self.tiles[CORNER_BR] = _load_road_tile(f"{roads_path}/road_asphalt27.png", grass)
 
     def _load_track(self, track_index: int):
         """Load track data based on index."""
@@ -71,6 +112,11 @@ class Track:
         else:
             self._create_figure8_track()
 
+    def _build_lookups(self):
+        """Flatten the tile grid into row-major tile and road lookups."""
+        self.tile_grid = bytes(tile for row in self.track_data for tile in row)
+        self.road_mask = [tile in ROAD_TILES for tile in self.tile_grid]
+
     def _create_oval_track(self):
         """Create a simple oval track."""
         G = GRASS
@@ -195,11 +241,42 @@ class Track:
         if col < 0 or col >= self.width or row < 0 or row >= self.height:
             return GRASS
 
-        return self.track_data[row][col]
+        return self.tile_grid[row * self.width + col]
 
     def is_on_road(self, x: float, y: float) -> bool:
         """Check if a position is on a road tile."""
-        return self.get_tile_at(x, y) in ROAD_TILES
+        col = int(x // self.tile_size)
+        row = int(y // self.tile_size)
+
+        if col < 0 or col >= self.width or row < 0 or row >= self.height:
+            return False
+
+        return self.road_mask[row * self.width + col]
+
+    def is_on_road_many(self, xs: Sequence[float], ys: Sequence[float]) -> List[bool]:
+        """
+        Check several positions against the road mask in one call.
+
+        Args:
+            xs: X positions to check
+            ys: Y positions to check
+
+        Returns:
+            List of booleans, True where the matching position is on road
+        """
+        tile_size = self.tile_size
+        width = self.width
+        height = self.height
+        road_mask = self.road_mask
+        result = []
+
+        for x, y in zip(xs, ys):
+            col = int(x // tile_size)
+            row = int(y // tile_size)
+            result.append(0 <= col < width and 0 <= row < height
+                          and road_mask[row * width + col])
+
+        return result
 
     def get_start_position(self) -> Tuple[float, float]:
         """Get the starting position for a car."""
@@ -266,6 +343,27 @@ class Track:
 
         return False
 
+    def _render_world(self) -> pygame.Surface:
+        """Render every tile and the finish line into one world-sized surface."""
+        world_surface = pygame.Surface(self.get_world_size()).convert()
+
+        tiles = self.tiles
+        xs = [col * self.tile_size for col in range(self.width)]
+        ys = [row * self.tile_size for row in range(self.height)]
+
+        # Every tile is opaque (roads are pre-blended), so one blit each
+        world_surface.blits([(tiles[tile_type], (x, y))
+                             for y, tile_row in zip(ys, self.track_data)
+                             for x, tile_type in zip(xs, tile_row)],
+                            doreturn=False)
+
+        # Draw finish line
+        pygame.draw.line(world_surface, (255, 255, 255),
+                         (self.finish_line_x, self.finish_line_y1),
+                         (self.finish_line_x, self.finish_line_y2), 5)
+
+        return world_surface
+
     def draw(self, screen: pygame.Surface, camera_offset: Tuple[float, float] = (0, 0)):
         """
         Draw the track.
@@ -274,38 +372,5 @@ class Track:
             screen: Pygame surface to draw on
             camera_offset: Tuple of (x, y) camera offset
         """
-        screen_width = screen.get_width()
-        screen_height = screen.get_height()
-
-        # Calculate visible tile range for optimization
-        start_col = max(0, int(camera_offset[0] // self.tile_size))
-        end_col = min(self.width, int((camera_offset[0] + screen_width) // self.tile_size) + 2)
-        start_row = max(0, int(camera_offset[1] // self.tile_size))
-        end_row = min(self.height, int((camera_offset[1] + screen_height) // self.tile_size) + 2)
-
-        # Draw visible tiles
-        for row in range(start_row, end_row):
-            for col in range(start_col, end_col):
-                tile_type = self.track_data[row][col]
-                tile_image = self.tiles[tile_type]
-
-                # Calculate screen position
-                world_x = col * self.tile_size
-                world_y = row * self.tile_size
-                screen_x = world_x - camera_offset[0]
-                screen_y = world_y - camera_offset[1]
-
-                # Draw grass first as background for all tiles
-                screen.blit(self.tiles[GRASS], (screen_x, screen_y))
-
-                # Draw road tile on top if not grass
-                if tile_type != GRASS:
-                    screen.blit(tile_image, (screen_x, screen_y))
-
-        # Draw finish line
-        finish_screen_x = self.finish_line_x - camera_offset[0]
-        finish_screen_y1 = self.finish_line_y1 - camera_offset[1]
-        finish_screen_y2 = self.finish_line_y2 - camera_offset[1]
-        pygame.draw.line(screen, (255, 255, 255),
-                        (finish_screen_x, finish_screen_y1),
-                        (finish_screen_x, finish_screen_y2), 5)
+        visible = pygame.Rect(camera_offset[0], camera_offset[1], screen.get_width(), screen.get_height())
+        screen.blit(self.world_surface, (0, 0), visible)
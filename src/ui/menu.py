@@ -3,18 +3,35 @@ Menu system for the racing game.
 """
 
 import pygame
-from enum import Enum
-from typing import List, Tuple, Callable
+from enum import IntEnum
+from typing import List, Optional, Tuple, Callable
 from src.car_stats import CAR_TYPES, CAR_COLORS
 
 
-class GameState(Enum):
-    MENU = "menu"
-    TRACK_SELECT = "track_select"
-    CAR_TYPE_SELECT = "car_type_select"
-    CAR_COLOR_SELECT = "car_color_select"
-    PLAYING = "playing"
-    PAUSED = "paused"
+# Stat bar layout on the vehicle selection screen
+STAT_BAR_X = 580
+STAT_BAR_WIDTH = 160
+STAT_BAR_HEIGHT = 10
+STAT_LABEL_X = 380
+
+# Car color names as shown in the menus
+CAR_COLORS_DISPLAY = tuple(color.capitalize() for color in CAR_COLORS)
+
+# Keys that step backwards/forwards through the selection screens
+PREV_KEYS = frozenset({pygame.K_UP, pygame.K_LEFT})
+NEXT_KEYS = frozenset({pygame.K_DOWN, pygame.K_RIGHT})
+
+# Every key any menu reacts to
+NAV_KEYS = PREV_KEYS | NEXT_KEYS | {pygame.K_RETURN, pygame.K_ESCAPE}
+
+
+class GameState(IntEnum):
+    MENU = 0
+    TRACK_SELECT = 1
+    CAR_TYPE_SELECT = 2
+    CAR_COLOR_SELECT = 3
+    PLAYING = 4
+    PAUSED = 5
 
 
 class Menu:
@@ -23,6 +40,7 @@ class Menu:
     def __init__(self, screen_width: int, screen_height: int):
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self._cx = screen_width // 2
 
         # Fonts
         self.title_font = pygame.font.Font(None, 72)
@@ -52,6 +70,61 @@ class Menu:
         self.selected_car_color = 0  # index into CAR_COLORS
         self.track_names = ["Oval", "Figure-8"]
 
+        # Option counts for wrapping the selection
+        self._n_main = len(self.main_options)
+        self._n_pause = len(self.pause_options)
+        self._n_tracks = len(self.track_names)
+        self._n_cars = len(CAR_TYPES)
+        self._n_colors = len(CAR_COLORS)
+
+        # Full-screen menus are static between inputs, so only repaint them
+        # after something changes
+        self._needs_redraw = True
+
+        # Text showing the current selections, rebuilt only when they change
+        self._dirty_info = True
+        self._track_info = None
+        self._car_info = None
+        self._color_title = None
+
+        # Rendered text surfaces by (font, text, color)
+        self._text_cache = {}
+
+        # Per-state input handlers and draw methods, indexed by GameState
+        # (PLAYING has no menu)
+        self._input_dispatch = [
+            self._handle_main_menu,         # MENU
+            self._handle_track_select,      # TRACK_SELECT
+            self._handle_car_type_select,   # CAR_TYPE_SELECT
+            self._handle_car_color_select,  # CAR_COLOR_SELECT
+            None,                           # PLAYING
+            self._handle_pause_menu,        # PAUSED
+        ]
+        self._draw_dispatch = [
+            self._draw_main_menu,           # MENU
+            self._draw_track_select,        # TRACK_SELECT
+            self._draw_car_type_select,     # CAR_TYPE_SELECT
+            self._draw_car_color_select,    # CAR_COLOR_SELECT
+            None,                           # PLAYING
+            self._draw_pause_menu,          # PAUSED
+        ]
+
+        # Vehicle rows: name, description and the filled width of each stat
+        # bar (stat relative to the best vehicle's), so the selection screen
+        # does no math per frame
+        self._car_rows = tuple(
+            (stats["name"], stats["description"],
+             int(STAT_BAR_WIDTH * (stats["max_velocity"] / 11.0)),   # max 11 for motorcycle
+             int(STAT_BAR_WIDTH * (stats["acceleration"] / 0.25)),   # max 0.25 for motorcycle
+             int(STAT_BAR_WIDTH * (stats["handling"] / 4.5)),        # max 4.5 for motorcycle
+             int(STAT_BAR_WIDTH * (stats["durability"] / 1.5)))      # max 1.5 for truck
+            for stats in CAR_TYPES.values()
+        )
+
+        # Pre-rendered constant text with screen positions
+        self._static = {}
+        self._prebuild_surfaces()
+
     def handle_input(self, event: pygame.event.Event, state: GameState) -> Tuple[GameState, dict]:
         """
         Handle menu input and return new state and any actions.
@@ -61,19 +134,16 @@ class Menu:
         """
         actions = {}
 
-        if event.type != pygame.KEYDOWN:
+        if event.type != pygame.KEYDOWN or event.key not in NAV_KEYS:
             return state, actions
 
-        if state == GameState.MENU:
-            return self._handle_main_menu(event)
-        elif state == GameState.TRACK_SELECT:
-            return self._handle_track_select(event)
-        elif state == GameState.CAR_TYPE_SELECT:
-            return self._handle_car_type_select(event)
-        elif state == GameState.CAR_COLOR_SELECT:
-            return self._handle_car_color_select(event)
-        elif state == GameState.PAUSED:
-            return self._handle_pause_menu(event)
+        handler = self._input_dispatch[state]
+        if handler:
+            selected_index = self.selected_index
+            new_state, actions = handler(event)
+            if new_state != state or self.selected_index != selected_index:
+                self._needs_redraw = True
+            return new_state, actions
 
         return state, actions
 
@@ -82,9 +152,9 @@ class Menu:
         actions = {}
 
         if event.key == pygame.K_UP:
-            self.selected_index = (self.selected_index - 1) % len(self.main_options)
+            self.selected_index = (self.selected_index - 1) % self._n_main
         elif event.key == pygame.K_DOWN:
-            self.selected_index = (self.selected_index + 1) % len(self.main_options)
+            self.selected_index = (self.selected_index + 1) % self._n_main
         elif event.key == pygame.K_RETURN:
             option = self.main_options[self.selected_index]
             if option == "Play":
@@ -104,12 +174,13 @@ class Menu:
         """Handle track selection input."""
         actions = {}
 
-        if event.key == pygame.K_UP or event.key == pygame.K_LEFT:
-            self.selected_index = (self.selected_index - 1) % len(self.track_names)
-        elif event.key == pygame.K_DOWN or event.key == pygame.K_RIGHT:
-            self.selected_index = (self.selected_index + 1) % len(self.track_names)
+        if event.key in PREV_KEYS:
+            self.selected_index = (self.selected_index - 1) % self._n_tracks
+        elif event.key in NEXT_KEYS:
+            self.selected_index = (self.selected_index + 1) % self._n_tracks
         elif event.key == pygame.K_RETURN:
             self.selected_track = self.selected_index
+            self._dirty_info = True
             actions["track_changed"] = self.selected_track
             self.selected_index = 0
             return GameState.MENU, actions
@@ -122,14 +193,15 @@ class Menu:
     def _handle_car_type_select(self, event) -> Tuple[GameState, dict]:
         """Handle car type selection input."""
         actions = {}
-        num_types = len(CAR_TYPES)
+        num_types = self._n_cars
 
-        if event.key == pygame.K_UP or event.key == pygame.K_LEFT:
+        if event.key in PREV_KEYS:
             self.selected_index = (self.selected_index - 1) % num_types
-        elif event.key == pygame.K_DOWN or event.key == pygame.K_RIGHT:
+        elif event.key in NEXT_KEYS:
             self.selected_index = (self.selected_index + 1) % num_types
         elif event.key == pygame.K_RETURN:
             self.selected_car_type = self.selected_index + 1  # Types are 1-5
+            self._dirty_info = True
             self.selected_index = self.selected_car_color
             return GameState.CAR_COLOR_SELECT, {}
         elif event.key == pygame.K_ESCAPE:
@@ -142,12 +214,13 @@ class Menu:
         """Handle car color selection input."""
         actions = {}
 
-        if event.key == pygame.K_UP or event.key == pygame.K_LEFT:
-            self.selected_index = (self.selected_index - 1) % len(CAR_COLORS)
-        elif event.key == pygame.K_DOWN or event.key == pygame.K_RIGHT:
-            self.selected_index = (self.selected_index + 1) % len(CAR_COLORS)
+        if event.key in PREV_KEYS:
+            self.selected_index = (self.selected_index - 1) % self._n_colors
+        elif event.key in NEXT_KEYS:
+            self.selected_index = (self.selected_index + 1) % self._n_colors
         elif event.key == pygame.K_RETURN:
             self.selected_car_color = self.selected_index
+            self._dirty_info = True
             actions["car_changed"] = {
                 "type": self.selected_car_type,
                 "color": CAR_COLORS[self.selected_car_color]
@@ -165,9 +238,9 @@ class Menu:
         actions = {}
 
         if event.key == pygame.K_UP:
-            self.selected_index = (self.selected_index - 1) % len(self.pause_options)
+            self.selected_index = (self.selected_index - 1) % self._n_pause
         elif event.key == pygame.K_DOWN:
-            self.selected_index = (self.selected_index + 1) % len(self.pause_options)
+            self.selected_index = (self.selected_index + 1) % self._n_pause
         elif event.key == pygame.K_RETURN:
             option = self.pause_options[self.selected_index]
             if option == "Resume":
@@ -185,190 +258,267 @@ class Menu:
 
         return GameState.PAUSED, actions
 
-    def draw(self, screen: pygame.Surface, state: GameState):
-        """Draw the appropriate menu screen."""
-        if state == GameState.MENU:
-            self._draw_main_menu(screen)
-        elif state == GameState.TRACK_SELECT:
-            self._draw_track_select(screen)
-        elif state == GameState.CAR_TYPE_SELECT:
-            self._draw_car_type_select(screen)
-        elif state == GameState.CAR_COLOR_SELECT:
-            self._draw_car_color_select(screen)
-        elif state == GameState.PAUSED:
-            self._draw_pause_menu(screen)
-
-    def _draw_main_menu(self, screen: pygame.Surface):
-        """Draw the main menu."""
-        screen.fill(self.dark_gray)
-
-        # Title
-        title = self.title_font.render("RACING GAME", True, self.white)
-        title_rect = title.get_rect(center=(self.screen_width // 2, 120))
-        screen.blit(title, title_rect)
-
-        # Options
-        start_y = 280
-        for i, option in enumerate(self.main_options):
-            color = self.green if i == self.selected_index else self.white
-            text = self.option_font.render(option, True, color)
-            rect = text.get_rect(center=(self.screen_width // 2, start_y + i * 60))
-            screen.blit(text, rect)
+    def _text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int],
+              background: Optional[Tuple[int, int, int]] = None) -> pygame.Surface:
+        """
+        Render text once and reuse the surface on later frames.
+
+        Args:
+            font: Font to render with
+            text: String to render
+            color: Text color
+            background: Solid color to antialias against, giving an opaque
+                surface that blits without per-pixel alpha. None keeps the
+                text transparent for drawing over the race.
+        """
+        key = (font, text, color, background)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Match the display format so later blits skip pixel conversion
+            if background is None:
+                surface = font.render(text, True, color).convert_alpha()
+            else:
+                surface = font.render(text, True, color, background).convert()
+            self._text_cache[key] = surface
+        return surface
+
+    def _prebuild_surfaces(self):
+        """Render every constant menu string once, along with where it goes."""
+        cx = self._cx
+        white, green, gray = self.white, self.green, self.gray
+
+        # Full-screen menus draw on a solid background, so their text is
+        # opaque; only the pause menu (drawn over the race) needs alpha
+        background = self.dark_gray
+
+        def text(font, label, color, background=background):
+            return self._text(font, label, color, background)
+
+        def centered(font, label, color, y, background=background):
+            # Blit position that centers the text on (cx, y)
+            surface = text(font, label, color, background)
+            w, h = surface.get_size()
+            return surface, (cx - w // 2, y - h // 2)
+
+        def options(labels, start_y, spacing, background=background):
+            # (unselected, selected, topleft) per option; both colors are the same size
+            rows = []
+            for i, label in enumerate(labels):
+                normal, topleft = centered(self.option_font, label, white, start_y + i * spacing, background)
+                rows.append((normal, text(self.option_font, label, green, background), topleft))
+            return rows
+
+        static = self._static
+
+        # Titles
+        static['title_main'] = centered(self.title_font, "RACING GAME", white, 120)
+        static['title_track'] = centered(self.title_font, "SELECT TRACK", white, 120)
+        static['title_vehicle'] = centered(self.title_font, "SELECT VEHICLE", white, 50)
+        static['title_pause'] = centered(self.title_font, "PAUSED", white, 200, None)
+
+        # Controls hints
+        static['hint_main'] = centered(self.hint_font, "Arrow Keys: Navigate | Enter: Select",
+                                       gray, self.screen_height - 40)
+        static['hint_select'] = centered(self.hint_font, "Arrow Keys: Select | Enter: Confirm | ESC: Back",
+                                         gray, self.screen_height - 40)
+        static['hint_vehicle'] = centered(self.hint_font, "Arrow Keys: Select | Enter: Choose Color | ESC: Back",
+                                          gray, self.screen_height - 30)
+        static['hint_pause'] = centered(self.hint_font, "Arrow Keys: Navigate | Enter: Select | ESC: Resume",
+                                        gray, self.screen_height - 60, None)
+
+        # Option lists
+        static['opt_main'] = options(self.main_options, 280, 60)
+        static['opt_track'] = options(self.track_names, 300, 80)
+        static['opt_color'] = options(CAR_COLORS_DISPLAY, 250, 60)
+        static['opt_pause'] = options(self.pause_options, 320, 60, None)
+
+        # Vehicle rows: (name, selected name, name topleft, description, selected description)
+        start_y = 110
+        row_height = 90
+        vehicles = []
+        for i, (car_name, description, *_) in enumerate(self._car_rows):
+            name = text(self.option_font, car_name, white)
+            vehicles.append((name, text(self.option_font, car_name, green),
+                             (80, start_y + i * row_height - name.get_height() // 2),
+                             text(self.hint_font, description, gray),
+                             text(self.hint_font, description, white)))
+        static['vehicles'] = vehicles
+
+        # Stat bar labels as (unselected, selected); their rows overlap, so
+        # they keep alpha rather than covering each other
+        static['stat_labels'] = [(text(self.hint_font, label, gray, None), text(self.hint_font, label, white, None))
+                                 for label in ("Speed", "Acceleration", "Handling", "Durability")]
+
+        # Stat bar background and full-width fills; partial fills blit a slice
+        bar_size = (STAT_BAR_WIDTH, STAT_BAR_HEIGHT)
+        static['bar_bg'] = pygame.Surface(bar_size).convert()
+        static['bar_bg'].fill((60, 60, 60))
+        fills = []
+        for fill_color in ((100, 200, 100), green):
+            fill = pygame.Surface(bar_size).convert()
+            fill.fill(fill_color)
+            fills.append(fill)
+        static['bar_fill'] = tuple(fills)
+
+        # Semi-transparent pause overlay
+        overlay = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        overlay.fill(self.black)
+        overlay.set_alpha(180)
+        static['pause_overlay'] = overlay
 
-        # Current selections
+    def _refresh_info(self):
+        """Re-render the text that depends on the selected track and car."""
+        info_x = self._cx - 100
         info_y = 520
-        track_info = self.hint_font.render(
-            f"Track: {self.track_names[self.selected_track]}", True, self.gray
+        self._track_info = (
+            self._text(self.hint_font, f"Track: {self.track_names[self.selected_track]}", self.gray,
+                       self.dark_gray),
+            (info_x, info_y)
         )
-        screen.blit(track_info, (self.screen_width // 2 - 100, info_y))
 
         car_type_name = CAR_TYPES[self.selected_car_type]["name"]
-        car_color_name = CAR_COLORS[self.selected_car_color].capitalize()
-        car_info = self.hint_font.render(
-            f"Car: {car_color_name} {car_type_name}", True, self.gray
+        car_color_name = CAR_COLORS_DISPLAY[self.selected_car_color]
+        self._car_info = (
+            self._text(self.hint_font, f"Car: {car_color_name} {car_type_name}", self.gray,
+                       self.dark_gray),
+            (info_x, info_y + 30)
         )
-        screen.blit(car_info, (self.screen_width // 2 - 100, info_y + 30))
 
-        # Controls hint
-        hint = self.hint_font.render("Arrow Keys: Navigate | Enter: Select", True, self.gray)
-        hint_rect = hint.get_rect(center=(self.screen_width // 2, self.screen_height - 40))
-        screen.blit(hint, hint_rect)
+        title = self._text(self.title_font, f"SELECT {car_type_name.upper()} COLOR", self.white,
+                           self.dark_gray)
+        self._color_title = (title, (self._cx - title.get_width() // 2, 120 - title.get_height() // 2))
 
-    def _draw_track_select(self, screen: pygame.Surface):
-        """Draw track selection screen."""
+        self._dirty_info = False
+
+    def invalidate(self):
+        """Force the next draw() to repaint (e.g. after the window is exposed)."""
+        self._needs_redraw = True
+
+    def needs_redraw(self) -> bool:
+        """Check whether the next draw() will repaint anything."""
+        return self._needs_redraw
+
+    def draw(self, screen: pygame.Surface, state: GameState) -> bool:
+        """
+        Draw the appropriate menu screen.
+
+        Menus are static between inputs, so they are only repainted after
+        input changed them or invalidate() was called. This includes the
+        pause menu, whose race underneath is frozen; the caller repaints
+        the race before the overlay only when needs_redraw() is True.
+
+        Returns:
+            True if anything was drawn
+        """
+        draw_screen = self._draw_dispatch[state]
+        if draw_screen is None or not self._needs_redraw:
+            return False
+
+        self._needs_redraw = False
+        draw_screen(screen)
+        return True
+
+    def _option_blits(self, options: list) -> list:
+        """Get blit args for a prebuilt option list, highlighting the selected entry."""
+        selected_index = self.selected_index
+        return [(selected if i == selected_index else normal, topleft)
+                for i, (normal, selected, topleft) in enumerate(options)]
+
+    def _draw_main_menu(self, screen: pygame.Surface):
+        """Draw the main menu."""
         screen.fill(self.dark_gray)
+        static = self._static
 
-        # Title
-        title = self.title_font.render("SELECT TRACK", True, self.white)
-        title_rect = title.get_rect(center=(self.screen_width // 2, 120))
-        screen.blit(title, title_rect)
+        # Current selections
+        if self._dirty_info:
+            self._refresh_info()
+
+        screen.blits([
+            static['title_main'],
+            *self._option_blits(static['opt_main']),
+            self._track_info,
+            self._car_info,
+            static['hint_main'],
+        ], doreturn=False)
 
-        # Track options
-        start_y = 300
-        for i, track in enumerate(self.track_names):
-            color = self.green if i == self.selected_index else self.white
-            text = self.option_font.render(track, True, color)
-            rect = text.get_rect(center=(self.screen_width // 2, start_y + i * 80))
-            screen.blit(text, rect)
+    def _draw_track_select(self, screen: pygame.Surface):
+        """Draw track selection screen."""
+        screen.fill(self.dark_gray)
+        static = self._static
 
-        # Hint
-        hint = self.hint_font.render("Arrow Keys: Select | Enter: Confirm | ESC: Back", True, self.gray)
-        hint_rect = hint.get_rect(center=(self.screen_width // 2, self.screen_height - 40))
-        screen.blit(hint, hint_rect)
+        screen.blits([
+            static['title_track'],
+            *self._option_blits(static['opt_track']),
+            static['hint_select'],
+        ], doreturn=False)
 
     def _draw_car_type_select(self, screen: pygame.Surface):
         """Draw car type selection screen with stats."""
         screen.fill(self.dark_gray)
+        static = self._static
 
-        # Title
-        title = self.title_font.render("SELECT VEHICLE", True, self.white)
-        title_rect = title.get_rect(center=(self.screen_width // 2, 50))
-        screen.blit(title, title_rect)
+        blit_args = [static['title_vehicle']]
+        append = blit_args.append
+        extend = blit_args.extend
 
         # Vehicle type options with stats
         start_y = 110
         row_height = 90
-        for i, (type_id, stats) in enumerate(CAR_TYPES.items()):
-            is_selected = i == self.selected_index
-            color = self.green if is_selected else self.white
+        speed_label, accel_label, handling_label, durability_label = static['stat_labels']
+        stat_bar_blits = self._stat_bar_blits
+        selected_index = self.selected_index
+        rows = zip(self._car_rows, static['vehicles'])
+        for i, (car_row, (name, name_selected, name_pos, desc, desc_selected)) in enumerate(rows):
+            _, _, speed_fill, accel_fill, handling_fill, durability_fill = car_row
+            is_selected = i == selected_index
+            row_y = start_y + i * row_height
 
             # Vehicle name
-            name_text = self.option_font.render(stats["name"], True, color)
-            name_rect = name_text.get_rect(midleft=(80, start_y + i * row_height))
-            screen.blit(name_text, name_rect)
-
-            # Stats bars - shifted right with proper label spacing
-            bar_x = 580
-            bar_width = 160
-            bar_height = 10
-            label_x = 380
-
-            # Speed bar (max 11 for motorcycle)
-            speed_pct = stats["max_velocity"] / 11.0
-            self._draw_stat_bar(screen, bar_x, start_y + i * row_height - 25, bar_width, bar_height,
-                              speed_pct, "Speed", is_selected, label_x)
-
-            # Acceleration bar (max 0.25 for motorcycle)
-            accel_pct = stats["acceleration"] / 0.25
-            self._draw_stat_bar(screen, bar_x, start_y + i * row_height - 10, bar_width, bar_height,
-                              accel_pct, "Acceleration", is_selected, label_x)
-
-            # Handling bar (max 4.5 for motorcycle)
-            handling_pct = stats["handling"] / 4.5
-            self._draw_stat_bar(screen, bar_x, start_y + i * row_height + 5, bar_width, bar_height,
-                              handling_pct, "Handling", is_selected, label_x)
-
-            # Durability bar (max 1.5 for truck)
-            durability_pct = stats["durability"] / 1.5
-            self._draw_stat_bar(screen, bar_x, start_y + i * row_height + 20, bar_width, bar_height,
-                              durability_pct, "Durability", is_selected, label_x)
+            append((name_selected if is_selected else name, name_pos))
+
+            # Speed, acceleration, handling and durability bars
+            extend(stat_bar_blits(row_y - 25, speed_fill, speed_label, is_selected))
+            extend(stat_bar_blits(row_y - 10, accel_fill, accel_label, is_selected))
+            extend(stat_bar_blits(row_y + 5, handling_fill, handling_label, is_selected))
+            extend(stat_bar_blits(row_y + 20, durability_fill, durability_label, is_selected))
 
             # Description
-            desc = self.hint_font.render(stats["description"], True, self.gray if not is_selected else self.white)
-            screen.blit(desc, (760, start_y + i * row_height - 5))
-
-        # Hint
-        hint = self.hint_font.render("Arrow Keys: Select | Enter: Choose Color | ESC: Back", True, self.gray)
-        hint_rect = hint.get_rect(center=(self.screen_width // 2, self.screen_height - 30))
-        screen.blit(hint, hint_rect)
-
-    def _draw_stat_bar(self, screen, x, y, width, height, pct, label, selected, label_x):
-        """Draw a stat bar with label."""
-        label_color = self.white if selected else self.gray
-        label_text = self.hint_font.render(label, True, label_color)
-        screen.blit(label_text, (label_x, y - 2))
-
-        # Background
-        pygame.draw.rect(screen, (60, 60, 60), (x, y, width, height))
-        # Filled portion
-        fill_color = self.green if selected else (100, 200, 100)
-        pygame.draw.rect(screen, fill_color, (x, y, int(width * pct), height))
+            append((desc_selected if is_selected else desc, (760, row_y - 5)))
+
+        append(static['hint_vehicle'])
+        screen.blits(blit_args, doreturn=False)
+
+    def _stat_bar_blits(self, y, fill_width, label, selected) -> tuple:
+        """Get blit args for a stat bar with its prebuilt (unselected, selected) label."""
+        static = self._static
+        return (
+            (label[selected], (STAT_LABEL_X, y - 2)),
+            # Background, then the filled portion of the full-width fill
+            (static['bar_bg'], (STAT_BAR_X, y)),
+            (static['bar_fill'][selected], (STAT_BAR_X, y), (0, 0, fill_width, STAT_BAR_HEIGHT)),
+        )
 
     def _draw_car_color_select(self, screen: pygame.Surface):
         """Draw car color selection screen."""
         screen.fill(self.dark_gray)
+        static = self._static
 
-        # Title
-        car_type_name = CAR_TYPES[self.selected_car_type]["name"]
-        title = self.title_font.render(f"SELECT {car_type_name.upper()} COLOR", True, self.white)
-        title_rect = title.get_rect(center=(self.screen_width // 2, 120))
-        screen.blit(title, title_rect)
-
-        # Car color options
-        start_y = 250
-        for i, color in enumerate(CAR_COLORS):
-            text_color = self.green if i == self.selected_index else self.white
-            text = self.option_font.render(color.capitalize(), True, text_color)
-            rect = text.get_rect(center=(self.screen_width // 2, start_y + i * 60))
-            screen.blit(text, rect)
-
-        # Hint
-        hint = self.hint_font.render("Arrow Keys: Select | Enter: Confirm | ESC: Back", True, self.gray)
-        hint_rect = hint.get_rect(center=(self.screen_width // 2, self.screen_height - 40))
-        screen.blit(hint, hint_rect)
+        # Title names the vehicle type just chosen
+        if self._dirty_info:
+            self._refresh_info()
+
+        screen.blits([
+            self._color_title,
+            *self._option_blits(static['opt_color']),
+            static['hint_select'],
+        ], doreturn=False)
 
     def _draw_pause_menu(self, screen: pygame.Surface):
         """Draw pause menu overlay."""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill(self.black)
-        overlay.set_alpha(180)
-        screen.blit(overlay, (0, 0))
-
-        # Title
-        title = self.title_font.render("PAUSED", True, self.white)
-        title_rect = title.get_rect(center=(self.screen_width // 2, 200))
-        screen.blit(title, title_rect)
-
-        # Options
-        start_y = 320
-        for i, option in enumerate(self.pause_options):
-            color = self.green if i == self.selected_index else self.white
-            text = self.option_font.render(option, True, color)
-            rect = text.get_rect(center=(self.screen_width // 2, start_y + i * 60))
-            screen.blit(text, rect)
-
-        # Hint
-        hint = self.hint_font.render("Arrow Keys: Navigate | Enter: Select | ESC: Resume", True, self.gray)
-        hint_rect = hint.get_rect(center=(self.screen_width // 2, self.screen_height - 60))
-        screen.blit(hint, hint_rect)
+        static = self._static
+        screen.blits([
+            (static['pause_overlay'], (0, 0)),
+            static['title_pause'],
+            *self._option_blits(static['opt_pause']),
+            static['hint_pause'],
+        ], doreturn=False)